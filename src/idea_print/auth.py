@@ -4,6 +4,7 @@ import hashlib
 import hmac
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass
@@ -14,18 +15,56 @@ class AuthResult:
     error: str | None = None
 
 
-def verify_signature(
-    body: bytes,
+# Signature algorithms, as sent in the X-Sig-Alg header
+SIG_ALG_HMAC_SHA256 = "hmac-sha256"
+SIG_ALG_BLAKE2B = "blake2b-keyed-v1"
+SIG_ALGORITHMS = (SIG_ALG_HMAC_SHA256, SIG_ALG_BLAKE2B)
+
+
+@lru_cache(maxsize=4)
+def _hmac_template(secret: str) -> hmac.HMAC:
+    """Build a keyed HMAC once per secret; callers must .copy() it before use."""
+    return hmac.new(secret.encode(), b"", hashlib.sha256)
+
+
+@lru_cache(maxsize=4)
+def _blake2b_template(secret: str) -> hashlib.blake2b:
+    """Build a keyed BLAKE2b once per secret; callers must .copy() it before use."""
+    # Derive a fixed-size key so secrets of any length can be used
+    key = hashlib.blake2b(secret.encode(), digest_size=32, person=b"idea-print-key").digest()
+    return hashlib.blake2b(key=key, digest_size=32)
+
+
+def _compute_digest(body: bytes, timestamp: bytes, secret: str, algorithm: str) -> bytes:
+    """Compute the raw signature digest over timestamp + body."""
+    if algorithm == SIG_ALG_BLAKE2B:
+        h = _blake2b_template(secret).copy()
+    else:
+        h = _hmac_template(secret).copy()
+    # Fed incrementally to avoid copying the body
+    h.update(timestamp)
+    h.update(body)
+    return h.digest()
+
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _is_hex(text: str) -> bool:
+    """Check that text consists only of hex digits."""
+    return _HEX_DIGITS.issuperset(text)
+
+
+def check_headers(
     signature: str,
     timestamp: str,
     secret: str,
     window_seconds: int = 300,
 ) -> AuthResult:
     """
-    Verify HMAC-SHA256 signature of request body.
+    Validate authentication headers that can be checked without the body.
 
     Args:
-        body: Raw request body bytes
         signature: Hex-encoded HMAC signature from X-Signature header
         timestamp: Unix timestamp string from X-Timestamp header
         secret: HMAC secret key
@@ -43,12 +82,13 @@ def verify_signature(
     if not timestamp:
         return AuthResult(success=False, error="Missing timestamp")
 
-    # Verify timestamp is within window
-    try:
-        ts = int(timestamp)
-    except ValueError:
+    # Verify timestamp is within window. Only short runs of ASCII digits
+    # are accepted; int() rejects strings over 4300 digits on CPython 3.11+
+    if not (timestamp.isascii() and timestamp.isdigit() and len(timestamp) <= 12):
         return AuthResult(success=False, error="Invalid timestamp format")
 
+    ts = int(timestamp)
+
     now = int(time.time())
     age = abs(now - ts)
 
@@ -58,37 +98,74 @@ def verify_signature(
             error=f"Timestamp too old: {age}s > {window_seconds}s",
         )
 
+    return AuthResult(success=True)
+
+
+def verify_signature(
+    body: bytes,
+    signature: str,
+    timestamp: str,
+    secret: str,
+    window_seconds: int = 300,
+    algorithm: str = SIG_ALG_HMAC_SHA256,
+) -> AuthResult:
+    """
+    Verify HMAC-SHA256 (or keyed BLAKE2b) signature of request body.
+
+    Args:
+        body: Raw request body bytes
+        signature: Hex-encoded HMAC signature from X-Signature header
+        timestamp: Unix timestamp string from X-Timestamp header
+        secret: HMAC secret key
+        window_seconds: Maximum age of timestamp in seconds
+        algorithm: Signature algorithm from X-Sig-Alg header
+
+    Returns:
+        AuthResult with success status and optional error message
+    """
+    result = check_headers(signature, timestamp, secret, window_seconds)
+    if not result.success:
+        return result
+
+    if algorithm not in SIG_ALGORITHMS:
+        return AuthResult(success=False, error=f"Unsupported signature algorithm: {algorithm}")
+
     # Compute expected signature
     # Sign: timestamp + body
-    message = timestamp.encode() + body
-    expected = hmac.new(
-        secret.encode(),
-        message,
-        hashlib.sha256,
-    ).hexdigest()
+    expected = _compute_digest(body, timestamp.encode(), secret, algorithm)
+
+    # Compare raw digests: half the bytes of the hex form, and hex case
+    # no longer matters. fromhex() skips whitespace, so check the exact
+    # format first.
+    if len(signature) != 2 * len(expected) or not _is_hex(signature):
+        return AuthResult(success=False, error="Invalid signature")
+    provided = bytes.fromhex(signature)
 
     # Constant-time comparison
-    if not hmac.compare_digest(signature, expected):
+    if not hmac.compare_digest(provided, expected):
         return AuthResult(success=False, error="Invalid signature")
 
     return AuthResult(success=True)
 
 
-def generate_signature(body: bytes, timestamp: int, secret: str) -> str:
+def generate_signature(
+    body: bytes,
+    timestamp: int,
+    secret: str,
+    algorithm: str = SIG_ALG_HMAC_SHA256,
+) -> str:
     """
-    Generate HMAC-SHA256 signature for request body.
+    Generate HMAC-SHA256 (or keyed BLAKE2b) signature for request body.
 
     Args:
         body: Raw request body bytes
         timestamp: Unix timestamp
         secret: HMAC secret key
+        algorithm: Signature algorithm (one of SIG_ALGORITHMS)
 
     Returns:
         Hex-encoded HMAC signature
     """
-    message = str(timestamp).encode() + body
-    return hmac.new(
-        secret.encode(),
-        message,
-        hashlib.sha256,
-    ).hexdigest()
+    if algorithm not in SIG_ALGORITHMS:
+        raise ValueError(f"Unsupported signature algorithm: {algorithm}")
+    return _compute_digest(body, str(timestamp).encode(), secret, algorithm).hex()
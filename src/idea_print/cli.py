@@ -41,10 +41,16 @@ def list_ports():
 
 
 @main.command("list-usb")
-def list_usb():
+@click.option(
+    "--all",
+    "include_unknown",
+    is_flag=True,
+    help="Include devices from vendors not known to make thermal printers",
+)
+def list_usb(include_unknown: bool):
     """List USB devices (potential printers)."""
     try:
-        devices = list_usb_printers()
+        devices = list_usb_printers(include_unknown=include_unknown)
     except ImportError:
         click.echo("Error: pyusb not installed", err=True)
         sys.exit(1)
@@ -53,7 +59,10 @@ def list_usb():
         sys.exit(1)
 
     if not devices:
-        click.echo("No USB devices found")
+        if include_unknown:
+            click.echo("No USB devices found")
+        else:
+            click.echo("No known USB printers found (use --all to list every device)")
         return
 
     click.echo("USB devices:\n")
@@ -156,7 +165,7 @@ def print_cmd(
     try:
         transport = SerialTransport(port=port, baudrate=baud)
         with transport:
-            transport.write(receipt_bytes)
+            transport.write_receipt(receipt_bytes)
         click.echo(f"Printed {len(receipt_bytes)} bytes to {port}")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
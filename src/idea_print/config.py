@@ -2,10 +2,11 @@
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Literal
 
 
-@dataclass
+@dataclass(frozen=True)
 class PrinterProfile:
     """Configuration for a thermal printer."""
 
@@ -54,6 +55,9 @@ class Config:
     dedupe_db_path: str = field(
         default_factory=lambda: os.environ.get("DEDUPE_DB_PATH", "dedupe.db")
     )
+    trust_local: bool = field(
+        default_factory=lambda: os.environ.get("TRUST_LOCAL", "false").lower() == "true"
+    )
 
     @classmethod
     def from_env(cls) -> "Config":
@@ -61,6 +65,11 @@ class Config:
         return cls()
 
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
-    """Get the current configuration."""
+    """
+    Get the process-wide configuration.
+
+    The environment is read once; call get_config.cache_clear() to reload.
+    """
     return Config.from_env()
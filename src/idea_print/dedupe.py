@@ -1,26 +1,123 @@
 """SQLite-based idempotency store for request deduplication."""
 
+import hashlib
+import logging
+import math
+import queue
 import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Number of recently seen request IDs kept in memory
+RECENT_CAPACITY = 10_000
+
+# Maximum number of queued inserts committed in one transaction
+WRITE_BATCH_SIZE = 100
+
+# Backoff between attempts to commit a failed batch (seconds)
+WRITE_RETRY_DELAY = 0.1
+WRITE_RETRY_MAX_DELAY = 5.0
+
+# Expected number of live request IDs, used to size the Bloom filter
+BLOOM_CAPACITY = 1_000_000
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over strings: no false negatives."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        """Yield bit positions for a key via double hashing."""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter."""
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Add several keys to the filter."""
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
 
 
 class DedupeStore:
     """SQLite store for tracking processed request IDs."""
 
-    def __init__(self, db_path: str | Path, ttl_seconds: int = 86400):
+    def __init__(
+        self,
+        db_path: str | Path,
+        ttl_seconds: int = 86400,
+        recent_capacity: int = RECENT_CAPACITY,
+        bloom_capacity: int = BLOOM_CAPACITY,
+    ):
         """
         Initialize the dedupe store.
 
         Args:
             db_path: Path to SQLite database file
             ttl_seconds: Time-to-live for entries (default 24 hours)
+            recent_capacity: Number of recent request IDs cached in memory
+            bloom_capacity: Expected number of stored IDs, for Bloom filter sizing
         """
         self.db_path = Path(db_path)
         self.ttl_seconds = ttl_seconds
+        self.recent_capacity = recent_capacity
+        self.bloom_capacity = bloom_capacity
+        self._lock = threading.Lock()
+        # Recently seen IDs (LRU order), consulted before the database.
+        # Guarded by _recent_lock, which is always taken before _lock.
+        self._recent: OrderedDict[str, int] = OrderedDict()
+        self._recent_lock = threading.Lock()
+        # New IDs are persisted by a background writer so request handlers
+        # never wait on a commit. None is the shutdown sentinel. IDs stay in
+        # _unwritten (under _recent_lock) until committed, so they are never
+        # missed if evicted from _recent first.
+        self._pending: queue.SimpleQueue[tuple[str, int] | None] = queue.SimpleQueue()
+        self._unwritten: set[str] = set()
+        self._closing = threading.Event()
+        # Every stored or pending ID is in the Bloom filter (under
+        # _recent_lock), so a miss proves an ID is new without a query
+        self._bloom = _BloomFilter(bloom_capacity)
+        # While cleanup_expired rebuilds the filter off-lock, IDs added to
+        # the live filter are also logged here and replayed into the new one
+        self._bloom_log: list[str] | None = None
+        self._cleanup_lock = threading.Lock()
+        # One long-lived connection keeps the page cache warm and avoids
+        # per-call connect/schema overhead. Autocommit mode; see _connection.
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
         self._init_db()
+        self._load_bloom()
+        self._writer = threading.Thread(
+            target=self._write_loop,
+            name="dedupe-writer",
+            daemon=True,
+        )
+        self._writer.start()
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
@@ -40,15 +137,113 @@ class DedupeStore:
                 """
             )
 
+    def _load_bloom(self) -> None:
+        """Rebuild the Bloom filter from stored and pending IDs."""
+        bloom = _BloomFilter(self.bloom_capacity)
+        with self._connection() as conn:
+            bloom.update(
+                row[0] for row in conn.execute("SELECT request_id FROM processed_requests")
+            )
+        bloom.update(self._unwritten)
+        self._bloom = bloom
+
     @contextmanager
     def _connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            yield conn
-            conn.commit()
-        finally:
-            conn.close()
+        """Get exclusive access to the shared database connection."""
+        with self._lock:
+            yield self._conn
+
+    def _write_loop(self) -> None:
+        """Persist queued request IDs in batched transactions."""
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+
+            batch = [item]
+            stopping = False
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    item = self._pending.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._write_batch(batch)
+
+            if stopping:
+                return
+
+    def _write_batch(self, batch: list[tuple[str, int]]) -> None:
+        """Commit a batch, retrying with backoff until it succeeds or the store closes."""
+        delay = WRITE_RETRY_DELAY
+        while True:
+            with self._connection() as conn:
+                try:
+                    conn.execute("BEGIN")
+                    conn.executemany(
+                        """
+                        INSERT OR IGNORE INTO processed_requests (request_id, processed_at)
+                        VALUES (?, ?)
+                        """,
+                        batch,
+                    )
+                    conn.execute("COMMIT")
+                    error = None
+                except sqlite3.Error as e:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    error = e
+
+            if error is None:
+                with self._recent_lock:
+                    self._unwritten.difference_update(rid for rid, _ in batch)
+                return
+
+            if self._closing.is_set():
+                # IDs stay in _unwritten, so they are still deduped in-process
+                logger.error(f"Failed to persist {len(batch)} request IDs at shutdown: {error}")
+                return
+
+            # Later batches wait behind this one; close() cuts the wait short
+            logger.warning(
+                f"Failed to persist {len(batch)} request IDs, retrying in {delay:g}s: {error}"
+            )
+            self._closing.wait(delay)
+            delay = min(delay * 2, WRITE_RETRY_MAX_DELAY)
+
+    def _bloom_add(self, request_id: str) -> None:
+        """Add a request ID to the Bloom filter. Caller holds _recent_lock."""
+        self._bloom.add(request_id)
+        if self._bloom_log is not None:
+            self._bloom_log.append(request_id)
+
+    def _remember(self, request_id: str, processed_at: int) -> None:
+        """Record a request ID in the in-memory LRU. Caller holds _recent_lock."""
+        self._recent[request_id] = processed_at
+        self._recent.move_to_end(request_id)
+        if len(self._recent) > self.recent_capacity:
+            self._recent.popitem(last=False)
+
+    def _stored_at(self, request_id: str) -> int | None:
+        """Look up when a request ID was stored, or None if it isn't."""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT processed_at FROM processed_requests WHERE request_id = ?",
+                (request_id,),
+            ).fetchone()
+            return None if row is None else row[0]
+
+    def close(self) -> None:
+        """Flush pending writes and close the database connection."""
+        self._closing.set()
+        self._pending.put(None)
+        self._writer.join()
+        with self._lock:
+            self._conn.close()
 
     def is_duplicate(self, request_id: str) -> bool:
         """
@@ -60,12 +255,12 @@ class DedupeStore:
         Returns:
             True if the request has been processed before
         """
-        with self._connection() as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM processed_requests WHERE request_id = ?",
-                (request_id,),
-            )
-            return cursor.fetchone() is not None
+        with self._recent_lock:
+            if request_id not in self._bloom:
+                return False
+            if request_id in self._recent or request_id in self._unwritten:
+                return True
+        return self._stored_at(request_id) is not None
 
     def mark_processed(self, request_id: str) -> None:
         """
@@ -75,6 +270,9 @@ class DedupeStore:
             request_id: Unique request identifier
         """
         now = int(time.time())
+        with self._recent_lock:
+            self._remember(request_id, now)
+            self._bloom_add(request_id)
         with self._connection() as conn:
             conn.execute(
                 """
@@ -92,12 +290,32 @@ class DedupeStore:
             Number of entries removed
         """
         cutoff = int(time.time()) - self.ttl_seconds
-        with self._connection() as conn:
-            cursor = conn.execute(
-                "DELETE FROM processed_requests WHERE processed_at < ?",
-                (cutoff,),
-            )
-            return cursor.rowcount
+        with self._cleanup_lock:
+            with self._recent_lock:
+                expired = [rid for rid, ts in self._recent.items() if ts < cutoff]
+                for rid in expired:
+                    del self._recent[rid]
+                with self._connection() as conn:
+                    cursor = conn.execute(
+                        "DELETE FROM processed_requests WHERE processed_at < ?",
+                        (cutoff,),
+                    )
+                    removed = cursor.rowcount
+                    rows = conn.execute("SELECT request_id FROM processed_requests").fetchall()
+                pending = list(self._unwritten)
+                self._bloom_log = []
+
+            # Bloom filters can't delete, so rebuild without the expired IDs.
+            # Hashing every row is slow, so it runs without holding the locks.
+            bloom = _BloomFilter(self.bloom_capacity)
+            bloom.update(row[0] for row in rows)
+            bloom.update(pending)
+
+            with self._recent_lock:
+                bloom.update(self._bloom_log)
+                self._bloom_log = None
+                self._bloom = bloom
+            return removed
 
     def check_and_mark(self, request_id: str) -> bool:
         """
@@ -110,16 +328,25 @@ class DedupeStore:
             True if this is a NEW request (not a duplicate)
         """
         now = int(time.time())
-        with self._connection() as conn:
-            # Try to insert; if it already exists, this will fail
-            try:
-                conn.execute(
-                    """
-                    INSERT INTO processed_requests (request_id, processed_at)
-                    VALUES (?, ?)
-                    """,
-                    (request_id, now),
-                )
-                return True  # New request
-            except sqlite3.IntegrityError:
-                return False  # Duplicate
+        with self._recent_lock:
+            if request_id in self._recent:
+                self._recent.move_to_end(request_id)
+                return False
+
+            # Only a Bloom hit (duplicate or false positive) needs the database
+            if request_id in self._bloom:
+                if request_id in self._unwritten:
+                    return False
+                processed_at = self._stored_at(request_id)
+                if processed_at is not None:
+                    # Cached under the stored time so it expires with the row
+                    self._remember(request_id, processed_at)
+                    return False
+
+            # Recorded in memory first, so repeats are caught before the
+            # background writer has persisted it
+            self._remember(request_id, now)
+            self._bloom_add(request_id)
+            self._unwritten.add(request_id)
+            self._pending.put((request_id, now))
+            return True
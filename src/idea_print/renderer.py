@@ -1,6 +1,6 @@
 """ESC/POS byte generation and text processing."""
 
-import textwrap
+import codecs
 from dataclasses import dataclass
 from typing import Literal
 
@@ -30,10 +30,15 @@ DOUBLE_WIDTH_ON = ESC + b"!\x20"  # ESC ! 32
 DOUBLE_SIZE_ON = ESC + b"!\x30"  # ESC ! 48
 NORMAL_SIZE = ESC + b"!\x00"  # ESC ! 0
 
-# Line feed
+# Line feed (ESC d n), precomputed for every valid n
+_FEED_TABLE = tuple(ESC + b"d" + bytes([n]) for n in range(256))
+
+
 def feed(n: int) -> bytes:
     """Generate feed command for n lines."""
-    return ESC + b"d" + bytes([n])
+    if not 0 <= n < 256:
+        raise ValueError("feed lines must be in range(0, 256)")
+    return _FEED_TABLE[n]
 
 
 # Paper cutting
@@ -44,6 +49,37 @@ CUT_PARTIAL = GS + b"V\x01"  # GS V 1 - Partial cut
 Alignment = Literal["left", "center", "right"]
 
 
+# Whitespace that separates words, as in textwrap: only ASCII whitespace,
+# so a no-break space keeps its words together
+_WHITESPACE_TO_SPACE = str.maketrans("\t\n\x0b\x0c\r", "     ")
+
+
+def _wrap(text: str, width: int) -> list[str]:
+    """Greedily wrap words to width; words longer than width overflow intact."""
+    lines: list[str] = []
+    line: list[str] = []
+    length = 0
+
+    for word in text.translate(_WHITESPACE_TO_SPACE).split(" "):
+        if not word:
+            continue
+        if not line:
+            line.append(word)
+            length = len(word)
+        elif length + 1 + len(word) > width:
+            lines.append(" ".join(line))
+            line = [word]
+            length = len(word)
+        else:
+            line.append(word)
+            length += 1 + len(word)
+
+    if line:
+        lines.append(" ".join(line))
+
+    return lines
+
+
 @dataclass
 class TextBlock:
     """A block of text with formatting."""
@@ -60,37 +96,27 @@ class Renderer:
 
     def __init__(self, profile: PrinterProfile | None = None):
         self.profile = profile or PrinterProfile()
+        self._encoder = codecs.getencoder(self.profile.encoding)
 
     def wrap_text(self, text: str) -> list[str]:
         """Wrap text to fit printer width, preserving paragraphs."""
-        width = self.profile.chars_per_line
         lines: list[str] = []
 
-        # Split on double newlines to preserve paragraphs
-        paragraphs = text.split("\n\n")
-
-        for i, paragraph in enumerate(paragraphs):
-            # Handle single newlines within paragraph
-            sub_paragraphs = paragraph.split("\n")
-            for sub in sub_paragraphs:
-                sub = sub.strip()
-                if not sub:
-                    lines.append("")
-                else:
-                    wrapped = textwrap.wrap(
-                        sub,
-                        width=width,
-                        break_long_words=False,
-                        break_on_hyphens=False,
-                    )
-                    lines.extend(wrapped if wrapped else [""])
-
-            # Add blank line between paragraphs (but not after last)
-            if i < len(paragraphs) - 1:
+        # Splitting on single newlines also preserves paragraphs: each
+        # "\n\n" yields an empty line, which is the blank separator
+        for sub in text.split("\n"):
+            sub = sub.strip()
+            if not sub:
                 lines.append("")
+            else:
+                lines.extend(_wrap(sub, self.profile.chars_per_line) or [""])
 
         return lines
 
+    def encode(self, text: str) -> bytes:
+        """Encode text for the printer, replacing unsupported characters."""
+        return self._encoder(text, "replace")[0]
+
     def render_alignment(self, align: Alignment) -> bytes:
         """Get alignment command bytes."""
         if align == "center":
@@ -101,67 +127,61 @@ class Renderer:
 
     def render_block(self, block: TextBlock) -> bytes:
         """Render a text block to ESC/POS bytes."""
-        output = bytearray()
+        parts: list[bytes] = []
 
         # Set alignment
-        output.extend(self.render_alignment(block.align))
+        parts.append(self.render_alignment(block.align))
 
         # Set formatting
         if block.bold:
-            output.extend(BOLD_ON)
+            parts.append(BOLD_ON)
 
         if block.double_height and block.double_width:
-            output.extend(DOUBLE_SIZE_ON)
+            parts.append(DOUBLE_SIZE_ON)
         elif block.double_height:
-            output.extend(DOUBLE_HEIGHT_ON)
+            parts.append(DOUBLE_HEIGHT_ON)
         elif block.double_width:
-            output.extend(DOUBLE_WIDTH_ON)
+            parts.append(DOUBLE_WIDTH_ON)
 
         # Wrap and encode text
-        effective_width = self.profile.chars_per_line
+        width = self.profile.chars_per_line
         if block.double_width:
-            effective_width //= 2
-
-        lines = textwrap.wrap(
-            block.text,
-            width=effective_width,
-            break_long_words=False,
-            break_on_hyphens=False,
-        ) if block.text.strip() else [block.text]
+            width //= 2
+        lines = _wrap(block.text, width) if block.text.strip() else [block.text]
 
-        for line in lines:
-            output.extend(line.encode(self.profile.encoding, errors="replace"))
-            output.extend(b"\n")
+        parts.append(self.encode("\n".join(lines) + "\n"))
 
         # Reset formatting
         if block.bold:
-            output.extend(BOLD_OFF)
+            parts.append(BOLD_OFF)
 
         if block.double_height or block.double_width:
-            output.extend(NORMAL_SIZE)
+            parts.append(NORMAL_SIZE)
 
-        return bytes(output)
+        return b"".join(parts)
 
     def render(self, blocks: list[TextBlock]) -> bytes:
         """Render multiple text blocks to a complete ESC/POS document."""
-        output = bytearray()
+        buf = bytearray()
+        self.render_into(blocks, buf)
+        return bytes(buf)
 
+    def render_into(self, blocks: list[TextBlock], buf: bytearray) -> None:
+        """Append a complete ESC/POS document to a caller-supplied buffer."""
         # Initialize printer
-        output.extend(INIT)
+        buf += INIT
 
         # Render each block
         for block in blocks:
-            output.extend(self.render_block(block))
+            buf += self.render_block(block)
 
         # Feed paper and cut
-        output.extend(feed(self.profile.feed_lines_before_cut))
+        buf += feed(self.profile.feed_lines_before_cut)
 
         if self.profile.cut_type == "full":
-            output.extend(CUT_FULL)
+            buf += CUT_FULL
         elif self.profile.cut_type == "partial":
-            output.extend(CUT_PARTIAL)
-
-        return bytes(output)
+            buf += CUT_PARTIAL
 
     def render_line(self, char: str = "-") -> bytes:
         """Render a horizontal line across the receipt."""
@@ -2,14 +2,15 @@
 
 import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import Depends, FastAPI, Header, HTTPException, Request
-from pydantic import BaseModel, Field
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, ValidationError
 
-from .auth import verify_signature
+from .auth import SIG_ALG_HMAC_SHA256, check_headers, verify_signature
 from .config import Config, PrinterProfile, get_config
 from .dedupe import DedupeStore
 from .template import build_receipt
@@ -17,8 +18,12 @@ from .transport import FileTransport, SerialTransport, UsbTransport
 
 logger = logging.getLogger(__name__)
 
-# Global print lock to serialize print operations
-_print_lock = asyncio.Lock()
+# Client addresses exempt from signature checks when TRUST_LOCAL is enabled
+LOOPBACK_HOSTS = frozenset({"127.0.0.1", "::1"})
+
+# Largest accepted /print body. Worst case is 10k chars of idea text outside
+# the BMP, which json.dumps escapes as 12-byte surrogate pairs, plus the IDs
+MAX_BODY_BYTES = 128 * 1024
 
 # Global dedupe store (initialized at startup if enabled)
 _dedupe_store: DedupeStore | None = None
@@ -48,6 +53,28 @@ class HealthResponse(BaseModel):
     dedupe_enabled: bool
 
 
+async def read_body(request: Request) -> bytes:
+    """Read the request body, rejecting oversized payloads before buffering them."""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_BODY_BYTES:
+        raise HTTPException(status_code=413, detail="Request body too large")
+
+    # Count as we read, since chunked bodies carry no Content-Length
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise HTTPException(status_code=413, detail="Request body too large")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def json_response(model: BaseModel) -> Response:
+    """Serialize a response model with pydantic-core, bypassing FastAPI's encoder."""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 def get_transport(config: Config):
     """Get the appropriate transport based on configuration."""
     if config.printer_transport == "file":
@@ -69,6 +96,44 @@ def get_transport(config: Config):
         raise ValueError(f"Unknown transport: {config.printer_transport}")
 
 
+def print_bytes(config: Config, receipt_bytes: bytes) -> None:
+    """Send receipt bytes to the configured printer (blocking)."""
+    transport = get_transport(config)
+    with transport:
+        transport.write(receipt_bytes)
+
+
+async def printer_worker(queue: asyncio.Queue) -> None:
+    """Print queued receipts one at a time, keeping blocking I/O off the event loop."""
+    while True:
+        receipt_bytes, done = await queue.get()
+        try:
+            await asyncio.to_thread(print_bytes, get_config(), receipt_bytes)
+        except Exception as e:
+            if not done.done():
+                done.set_exception(e)
+        else:
+            if not done.done():
+                done.set_result(None)
+        finally:
+            queue.task_done()
+
+
+def get_print_queue(app: FastAPI) -> asyncio.Queue:
+    """
+    Return the app's print queue, starting its worker if needed.
+
+    The lifespan starts the worker, but it doesn't run when the app is
+    mounted as a sub-application or driven without lifespan events, so the
+    worker is also started on first use (once per event loop).
+    """
+    task = getattr(app.state, "printer_task", None)
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        app.state.print_queue = asyncio.Queue()
+        app.state.printer_task = asyncio.create_task(printer_worker(app.state.print_queue))
+    return app.state.print_queue
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
@@ -79,11 +144,23 @@ async def lifespan(app: FastAPI):
         _dedupe_store = DedupeStore(config.dedupe_db_path)
         logger.info(f"Dedupe store initialized at {config.dedupe_db_path}")
 
+    # Single worker task serializes print operations
+    get_print_queue(app)
+
     logger.info(f"Server starting with transport: {config.printer_transport}")
     yield
 
     logger.info("Server shutting down")
 
+    app.state.printer_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await app.state.printer_task
+    app.state.printer_task = None
+
+    if _dedupe_store:
+        _dedupe_store.close()
+        _dedupe_store = None
+
 
 app = FastAPI(
     title="idea-print",
@@ -97,10 +174,12 @@ app = FastAPI(
 async def health():
     """Health check endpoint."""
     config = get_config()
-    return HealthResponse(
-        status="ok",
-        transport=config.printer_transport,
-        dedupe_enabled=config.dedupe_enabled,
+    return json_response(
+        HealthResponse(
+            status="ok",
+            transport=config.printer_transport,
+            dedupe_enabled=config.dedupe_enabled,
+        )
     )
 
 
@@ -108,6 +187,7 @@ async def verify_auth(
     request: Request,
     x_timestamp: Annotated[str | None, Header()] = None,
     x_signature: Annotated[str | None, Header()] = None,
+    x_sig_alg: Annotated[str | None, Header()] = None,
 ) -> None:
     """Dependency to verify request authentication."""
     config = get_config()
@@ -117,7 +197,25 @@ async def verify_auth(
         logger.warning("HMAC_SECRET not set, skipping authentication")
         return
 
-    body = await request.body()
+    # Opt-in: trust callers on the same host without verifying signatures
+    if config.trust_local and request.client and request.client.host in LOOPBACK_HOSTS:
+        return
+
+    # Reject stale or malformed headers before buffering the body
+    result = check_headers(
+        signature=x_signature or "",
+        timestamp=x_timestamp or "",
+        secret=config.hmac_secret,
+        window_seconds=config.timestamp_window_seconds,
+    )
+
+    if not result.success:
+        logger.warning(f"Auth failed: {result.error}")
+        raise HTTPException(status_code=401, detail=result.error)
+
+    body = await read_body(request)
+    # Stash the raw body so the handler can parse it without re-reading
+    request.state.raw_body = body
 
     result = verify_signature(
         body=body,
@@ -125,6 +223,7 @@ async def verify_auth(
         timestamp=x_timestamp or "",
         secret=config.hmac_secret,
         window_seconds=config.timestamp_window_seconds,
+        algorithm=x_sig_alg or SIG_ALG_HMAC_SHA256,
     )
 
     if not result.success:
@@ -132,19 +231,48 @@ async def verify_auth(
         raise HTTPException(status_code=401, detail=result.error)
 
 
-@app.post("/print", response_model=PrintResponse, dependencies=[Depends(verify_auth)])
-async def print_receipt(request: Request, body: PrintRequest):
+async def parse_print_request(request: Request) -> PrintRequest:
+    """Parse the request body, reusing the bytes read during auth if present."""
+    raw_body = getattr(request.state, "raw_body", None)
+    if raw_body is None:
+        raw_body = await read_body(request)
+
+    try:
+        return PrintRequest.model_validate_json(raw_body)
+    except ValidationError as e:
+        # Match the error shape FastAPI produces for bound body parameters
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors)
+
+
+@app.post(
+    "/print",
+    response_model=PrintResponse,
+    dependencies=[Depends(verify_auth)],
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": PrintRequest.model_json_schema()}},
+            "required": True,
+        }
+    },
+)
+async def print_receipt(request: Request):
     """Print a receipt with the given idea text."""
-    config = get_config()
+    body = await parse_print_request(request)
 
     # Check for duplicate if dedupe is enabled
     if _dedupe_store and body.request_id:
         if not _dedupe_store.check_and_mark(body.request_id):
             logger.info(f"Duplicate request: {body.request_id}")
-            return PrintResponse(
-                success=True,
-                message="Duplicate request (already processed)",
-                idea_id=body.idea_id,
+            return json_response(
+                PrintResponse(
+                    success=True,
+                    message="Duplicate request (already processed)",
+                    idea_id=body.idea_id,
+                )
             )
 
     # Build receipt
@@ -156,24 +284,25 @@ async def print_receipt(request: Request, body: PrintRequest):
         profile=profile,
     )
 
-    # Acquire lock and print
-    async with _print_lock:
-        try:
-            transport = get_transport(config)
-            with transport:
-                transport.write(receipt_bytes)
+    # Hand off to the printer worker and wait for the result
+    done = asyncio.get_running_loop().create_future()
+    await get_print_queue(request.app).put((receipt_bytes, done))
 
-            logger.info(f"Printed receipt for idea: {body.idea_id or 'unnamed'}")
+    try:
+        await done
+    except Exception as e:
+        logger.error(f"Print failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Print failed: {str(e)}")
 
-            return PrintResponse(
-                success=True,
-                message="Receipt printed successfully",
-                idea_id=body.idea_id,
-            )
+    logger.info(f"Printed receipt for idea: {body.idea_id or 'unnamed'}")
 
-        except Exception as e:
-            logger.error(f"Print failed: {e}")
-            raise HTTPException(status_code=500, detail=f"Print failed: {str(e)}")
+    return json_response(
+        PrintResponse(
+            success=True,
+            message="Receipt printed successfully",
+            idea_id=body.idea_id,
+        )
+    )
 
 
 def create_app() -> FastAPI:
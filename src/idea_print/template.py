@@ -1,6 +1,8 @@
 """Receipt template with ASCII art header and layout."""
 
 from datetime import datetime
+from functools import lru_cache
+from typing import Callable
 
 from .config import PrinterProfile
 from .renderer import (
@@ -41,6 +43,82 @@ HEADER_ART_NARROW = r"""
 """
 
 
+def _encode_header(art: str, encoding: str) -> bytes:
+    """Encode header art to bytes, one newline-terminated line per row."""
+    lines = art.strip().split("\n")
+    return "".join(line + "\n" for line in lines).encode(encoding, errors="replace")
+
+
+# Headers pre-encoded for the default codepage
+_HEADER_BYTES_WIDE = _encode_header(HEADER_ART, "cp437")
+_HEADER_BYTES_NARROW = _encode_header(HEADER_ART_NARROW, "cp437")
+
+
+def _header_bytes(profile: PrinterProfile) -> bytes:
+    """Get the encoded header art for a profile's width and encoding."""
+    narrow = profile.chars_per_line < 42
+    if profile.encoding == "cp437":
+        return _HEADER_BYTES_NARROW if narrow else _HEADER_BYTES_WIDE
+    return _encode_header(HEADER_ART_NARROW if narrow else HEADER_ART, profile.encoding)
+
+
+@lru_cache(maxsize=8)
+def _renderer_for(profile: PrinterProfile) -> Renderer:
+    """Get a shared Renderer per profile, so its encoder is looked up once."""
+    return Renderer(profile)
+
+
+@lru_cache(maxsize=8)
+def _compile_stamp(profile: PrinterProfile) -> Callable[[bytes, bytes], bytes]:
+    """
+    Precompute the static parts of a receipt for a profile.
+
+    Returns a function taking the encoded metadata lines (timestamp, ID)
+    and the encoded idea text, which splices them between the fixed
+    header, dividers and footer.
+    """
+    divider = _renderer_for(profile).render_line("=")
+
+    prefix_parts = [
+        INIT,
+        # Header art (centered)
+        ALIGN_CENTER,
+        _header_bytes(profile),
+        b"\n",
+        # Title
+        BOLD_ON,
+        "NEW IDEA".encode(profile.encoding),
+        b"\n",
+        BOLD_OFF,
+    ]
+    prefix = b"".join(prefix_parts)
+
+    # Blank line, then divider above the idea text
+    middle = b"\n" + ALIGN_LEFT + divider
+
+    suffix_parts = [
+        # Bottom divider
+        divider,
+        # Footer
+        ALIGN_CENTER,
+        b"\n",
+        "* * *".encode(profile.encoding),
+        b"\n",
+        # Feed and cut
+        feed(profile.feed_lines_before_cut),
+    ]
+    if profile.cut_type == "full":
+        suffix_parts.append(CUT_FULL)
+    elif profile.cut_type == "partial":
+        suffix_parts.append(CUT_PARTIAL)
+    suffix = b"".join(suffix_parts)
+
+    def stamp(meta: bytes, body: bytes) -> bytes:
+        return b"".join((prefix, meta, middle, body, suffix))
+
+    return stamp
+
+
 def build_receipt(
     idea_text: str,
     idea_id: str | None = None,
@@ -49,70 +127,23 @@ def build_receipt(
 ) -> bytes:
     """Build a complete receipt with header, idea text, and footer."""
     profile = profile or PrinterProfile()
-    renderer = Renderer(profile)
+    renderer = _renderer_for(profile)
     timestamp = timestamp or datetime.now()
 
-    output = bytearray()
-
-    # Initialize
-    output.extend(INIT)
-
-    # Header art (centered)
-    output.extend(ALIGN_CENTER)
-    header = HEADER_ART_NARROW if profile.chars_per_line < 42 else HEADER_ART
-    for line in header.strip().split("\n"):
-        output.extend(line.encode(profile.encoding, errors="replace"))
-        output.extend(b"\n")
-
-    # Blank line
-    output.extend(b"\n")
-
-    # Title
-    output.extend(BOLD_ON)
-    output.extend("NEW IDEA".encode(profile.encoding))
-    output.extend(b"\n")
-    output.extend(BOLD_OFF)
-
-    # Timestamp
-    ts_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-    output.extend(ts_str.encode(profile.encoding))
-    output.extend(b"\n")
-
-    # ID if provided
+    # Timestamp, and ID if provided
+    t = timestamp
+    meta = (
+        f"{t.year:04d}-{t.month:02d}-{t.day:02d} "
+        f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}\n"
+    )
     if idea_id:
-        output.extend(f"ID: {idea_id}".encode(profile.encoding))
-        output.extend(b"\n")
-
-    output.extend(b"\n")
-
-    # Divider
-    output.extend(ALIGN_LEFT)
-    output.extend(renderer.render_line("="))
+        meta += f"ID: {idea_id}\n"
 
     # Idea text (wrapped)
     lines = renderer.wrap_text(idea_text)
-    for line in lines:
-        output.extend(line.encode(profile.encoding, errors="replace"))
-        output.extend(b"\n")
-
-    # Bottom divider
-    output.extend(renderer.render_line("="))
-
-    # Footer
-    output.extend(ALIGN_CENTER)
-    output.extend(b"\n")
-    output.extend("* * *".encode(profile.encoding))
-    output.extend(b"\n")
-
-    # Feed and cut
-    output.extend(feed(profile.feed_lines_before_cut))
-
-    if profile.cut_type == "full":
-        output.extend(CUT_FULL)
-    elif profile.cut_type == "partial":
-        output.extend(CUT_PARTIAL)
+    body = renderer.encode("\n".join(lines) + "\n")
 
-    return bytes(output)
+    return _compile_stamp(profile)(renderer.encode(meta), body)
 
 
 def build_test_receipt(profile: PrinterProfile | None = None) -> bytes:
@@ -2,7 +2,14 @@
 
 from .base import Transport
 from .file import FileTransport
+from .memory import MemoryTransport
 from .serial import SerialTransport
 from .usb import UsbTransport
 
-__all__ = ["Transport", "FileTransport", "SerialTransport", "UsbTransport"]
+__all__ = [
+    "Transport",
+    "FileTransport",
+    "MemoryTransport",
+    "SerialTransport",
+    "UsbTransport",
+]
@@ -1,11 +1,16 @@
 """Base transport interface."""
 
-from typing import Protocol, runtime_checkable
+from typing import Iterable, Protocol, runtime_checkable
 
 
 @runtime_checkable
 class Transport(Protocol):
-    """Protocol for printer transport implementations."""
+    """
+    Protocol for printer transport implementations.
+
+    Each write() call is one device write, so callers should pass a whole
+    receipt at once (or use write_many) rather than writing fragments.
+    """
 
     def open(self) -> None:
         """Open the transport connection."""
@@ -19,6 +24,10 @@ class Transport(Protocol):
         """Write data to the printer. Returns bytes written."""
         ...
 
+    def write_many(self, chunks: Iterable[bytes]) -> int:
+        """Join fragments and write them as one payload. Returns bytes written."""
+        ...
+
     def __enter__(self) -> "Transport":
         """Context manager entry."""
         ...
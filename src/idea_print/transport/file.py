@@ -1,7 +1,11 @@
 """File-based transport for development and testing."""
 
+import os
 from pathlib import Path
-from typing import BinaryIO
+from typing import Iterable
+
+# O_BINARY only exists (and matters) on Windows
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
 
 class FileTransport:
@@ -9,23 +13,34 @@ class FileTransport:
 
     def __init__(self, path: str | Path):
         self.path = Path(path)
-        self._file: BinaryIO | None = None
+        self._fd: int | None = None
 
     def open(self) -> None:
         """Open the file for writing."""
-        self._file = open(self.path, "wb")
+        # Raw descriptor: receipts are written once, so Python-level
+        # buffering would only add a copy
+        self._fd = os.open(self.path, _OPEN_FLAGS, 0o644)
 
     def close(self) -> None:
         """Close the file."""
-        if self._file:
-            self._file.close()
-            self._file = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
 
     def write(self, data: bytes) -> int:
         """Write data to the file."""
-        if not self._file:
+        if self._fd is None:
             raise RuntimeError("Transport not open")
-        return self._file.write(data)
+
+        view = memoryview(data)
+        written = 0
+        while written < view.nbytes:
+            written += os.write(self._fd, view[written:])
+        return written
+
+    def write_many(self, chunks: Iterable[bytes]) -> int:
+        """Join fragments and write them as a single payload."""
+        return self.write(b"".join(chunks))
 
     def __enter__(self) -> "FileTransport":
         """Context manager entry."""
@@ -0,0 +1,37 @@
+"""In-memory transport for tests."""
+
+from typing import Iterable
+
+
+class MemoryTransport:
+    """Transport that collects written bytes in memory (for tests)."""
+
+    def __init__(self):
+        self.buf = bytearray()
+
+    def open(self) -> None:
+        """Nothing to open."""
+
+    def close(self) -> None:
+        """Nothing to close; written bytes stay in buf."""
+
+    def write(self, data: bytes) -> int:
+        """Append data to the buffer."""
+        self.buf += data
+        return len(data)
+
+    def write_many(self, chunks: Iterable[bytes]) -> int:
+        """Append each fragment to the buffer."""
+        start = len(self.buf)
+        for chunk in chunks:
+            self.buf += chunk
+        return len(self.buf) - start
+
+    def __enter__(self) -> "MemoryTransport":
+        """Context manager entry."""
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
@@ -1,10 +1,37 @@
 """Serial port transport for thermal printers."""
 
-from typing import TYPE_CHECKING
+import os
+import select
+import time
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from serial import Serial
 
+# pyserial modules, imported on first use
+_serial_mod = None
+_list_ports_mod = None
+
+
+def _get_serial():
+    """Import pyserial once and return the module."""
+    global _serial_mod
+    if _serial_mod is None:
+        import serial
+
+        _serial_mod = serial
+    return _serial_mod
+
+
+def _get_list_ports():
+    """Import pyserial's port enumeration once and return the module."""
+    global _list_ports_mod
+    if _list_ports_mod is None:
+        from serial.tools import list_ports
+
+        _list_ports_mod = list_ports
+    return _list_ports_mod
+
 
 class SerialTransport:
     """Transport for serial port communication with thermal printers."""
@@ -14,33 +41,103 @@ class SerialTransport:
         port: str,
         baudrate: int = 9600,
         timeout: float = 5.0,
+        write_timeout: float | None = None,
     ):
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
+        self.write_timeout = write_timeout
         self._serial: "Serial | None" = None
+        self._fd: int | None = None
 
     def open(self) -> None:
         """Open the serial port."""
-        import serial
-
+        serial = _get_serial()
         self._serial = serial.Serial(
             port=self.port,
             baudrate=self.baudrate,
             timeout=self.timeout,
+            write_timeout=self.write_timeout,
+            xonxoff=False,
+            rtscts=False,
         )
+        # Write to the descriptor directly where there is one (POSIX);
+        # pyserial copies the unsent remainder on every pass of its loop
+        try:
+            self._fd = self._serial.fileno()
+        except (AttributeError, OSError):
+            self._fd = None
+        else:
+            os.set_blocking(self._fd, False)
 
     def close(self) -> None:
         """Close the serial port."""
         if self._serial:
             self._serial.close()
             self._serial = None
+            self._fd = None
 
     def write(self, data: bytes) -> int:
-        """Write data to the serial port."""
+        """
+        Write data to the serial port, honoring write_timeout.
+
+        Like pyserial, a write_timeout of 0 writes only what the port accepts
+        without blocking and returns that count.
+        """
+        if not self._serial:
+            raise RuntimeError("Transport not open")
+        if self._fd is None:
+            return self._serial.write(data)
+        if self.write_timeout == 0:
+            # As in pyserial: write what fits and report how much that was
+            return len(data) - len(self.write_nowait(data))
+
+        deadline = None
+        if self.write_timeout is not None:
+            deadline = time.monotonic() + self.write_timeout
+
+        view = self.write_nowait(data)
+        while view:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            _, writable, _ = select.select([], [self._fd], [], timeout)
+            if not writable:
+                raise _get_serial().SerialTimeoutException("Write timeout")
+            view = self.write_nowait(view)
+        return len(data)
+
+    def write_nowait(self, data: bytes | memoryview) -> memoryview:
+        """
+        Write as much data as the port accepts without blocking.
+
+        Returns:
+            The unwritten remainder (empty when done), to pass back in later
+        """
         if not self._serial:
             raise RuntimeError("Transport not open")
-        return self._serial.write(data)
+        view = memoryview(data)
+        if self._fd is None:
+            # No descriptor to poll; pyserial's write blocks until done
+            self._serial.write(view)
+            return view[len(view) :]
+
+        while view:
+            try:
+                written = os.write(self._fd, view)
+            except BlockingIOError:
+                break
+            view = view[written:]
+        return view
+
+    def write_receipt(self, data: bytes) -> int:
+        """Write a complete receipt and block until it has left the UART."""
+        written = self.write(data)
+        # Drain once per receipt, never between fragments
+        self._serial.flush()
+        return written
+
+    def write_many(self, chunks: Iterable[bytes]) -> int:
+        """Join fragments and write them as a single payload."""
+        return self.write(b"".join(chunks))
 
     def __enter__(self) -> "SerialTransport":
         """Context manager entry."""
@@ -54,7 +151,7 @@ class SerialTransport:
 
 def list_serial_ports() -> list[dict[str, str]]:
     """List available serial ports."""
-    from serial.tools import list_ports
+    list_ports = _get_list_ports()
 
     ports = []
     for port in list_ports.comports():
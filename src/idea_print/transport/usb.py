@@ -1,10 +1,70 @@
 """USB transport for thermal printers using pyusb."""
 
-from typing import TYPE_CHECKING
+import array
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     import usb.core
 
+# Bytes submitted per bulk transfer. A multiple of every standard bulk
+# wMaxPacketSize (64/512/1024), so only the final transfer can be short.
+TRANSFER_SIZE = 16 * 1024
+
+# Common thermal printer vendor IDs
+KNOWN_PRINTER_VIDS = frozenset(
+    {
+        0x0483,  # STMicroelectronics (many thermal printers)
+        0x0416,  # WinChipHead (CH340)
+        0x1A86,  # QinHeng Electronics
+        0x04B8,  # Epson
+        0x0DD4,  # Custom Engineering
+    }
+)
+
+# Seconds a device enumeration stays valid for UsbTransport.open
+ENUM_CACHE_TTL = 2.0
+
+# pyusb package (with core and util loaded), imported on first use
+_usb_mod = None
+
+# Last enumeration from list_usb_printers, as (monotonic time, devices)
+_enum_cache: "tuple[float, list[usb.core.Device]] | None" = None
+
+
+def _get_usb():
+    """Import pyusb once and return the package."""
+    global _usb_mod
+    if _usb_mod is None:
+        import usb.core
+        import usb.util
+
+        _usb_mod = usb
+    return _usb_mod
+
+
+def _find_cached(vendor_id: int, product_id: int) -> "usb.core.Device | None":
+    """Look up a device in a fresh cached enumeration, if there is one."""
+    global _enum_cache
+    if _enum_cache is None:
+        return None
+    timestamp, devices = _enum_cache
+    if time.monotonic() - timestamp >= ENUM_CACHE_TTL:
+        # Drop it so the listed devices (and their handles) can be freed
+        _enum_cache = None
+        return None
+    for device in devices:
+        if device.idVendor == vendor_id and device.idProduct == product_id:
+            return device
+    return None
+
+
+def _invalidate_enum_cache() -> None:
+    """Drop the cached enumeration."""
+    global _enum_cache
+    _enum_cache = None
+
 
 class UsbTransport:
     """Transport for direct USB communication with thermal printers."""
@@ -22,22 +82,36 @@ class UsbTransport:
         self.interface = interface
         self._device: "usb.core.Device | None" = None
         self._endpoint = None
+        # Runs write_async transfers in submission order; created on first use
+        self._executor: ThreadPoolExecutor | None = None
 
     def open(self) -> None:
         """Open the USB device."""
-        import usb.core
-        import usb.util
-
-        self._device = usb.core.find(
-            idVendor=self.vendor_id,
-            idProduct=self.product_id,
-        )
+        usb = _get_usb()
+        # Reuse a just-listed device rather than walking the bus again
+        self._device = _find_cached(self.vendor_id, self.product_id)
+        if self._device is None:
+            self._device = usb.core.find(
+                idVendor=self.vendor_id,
+                idProduct=self.product_id,
+            )
 
         if self._device is None:
             raise RuntimeError(
                 f"USB device not found: {self.vendor_id:04x}:{self.product_id:04x}"
             )
 
+        try:
+            self._configure()
+        except usb.core.USBError:
+            # The cached device may have gone away; enumerate afresh next time
+            _invalidate_enum_cache()
+            raise
+
+    def _configure(self) -> None:
+        """Claim the device and locate its OUT endpoint."""
+        usb = _get_usb()
+
         # Detach kernel driver if necessary
         try:
             if self._device.is_kernel_driver_active(self.interface):
@@ -72,19 +146,67 @@ class UsbTransport:
             raise RuntimeError("Could not find OUT endpoint")
 
     def close(self) -> None:
-        """Close the USB device."""
+        """Close the USB device, waiting for pending asynchronous writes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
         if self._device:
-            import usb.util
-
-            usb.util.dispose_resources(self._device)
+            _get_usb().util.dispose_resources(self._device)
             self._device = None
             self._endpoint = None
 
     def write(self, data: bytes) -> int:
-        """Write data to the USB device."""
+        """Write data to the USB device in bulk transfers of up to TRANSFER_SIZE."""
         if not self._device or not self._endpoint:
             raise RuntimeError("Transport not open")
-        return self._endpoint.write(data)
+
+        # Once asynchronous writes are in use, queue behind them to keep order
+        if self._executor is not None:
+            return self._executor.submit(self._write, data).result()
+        return self._write(data)
+
+    def write_async(self, data: bytes) -> "Future[int]":
+        """
+        Queue data for writing on a background thread and return immediately.
+
+        Writes complete in submission order. pyusb has no asynchronous API,
+        so this overlaps the blocking transfer with the caller's work rather
+        than submitting it to libusb directly.
+
+        Returns:
+            Future resolving to the number of bytes written
+        """
+        if not self._device or not self._endpoint:
+            raise RuntimeError("Transport not open")
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="usb-write"
+            )
+        return self._executor.submit(self._write, data)
+
+    def _write(self, data: bytes) -> int:
+        """Write data in bulk transfers; runs on the caller or writer thread."""
+        # pyusb passes array('B') straight to libusb; anything else is
+        # converted on every transfer, so convert the payload once up front
+        buf = array.array("B", data)
+        total = len(buf)
+        offset = 0
+        while offset < total:
+            # Resume after short writes rather than dropping the remainder
+            if offset == 0 and total <= TRANSFER_SIZE:
+                chunk = buf
+            else:
+                chunk = buf[offset : offset + TRANSFER_SIZE]
+            written = self._endpoint.write(chunk)
+            if written <= 0:
+                raise RuntimeError("USB write made no progress")
+            offset += written
+        return total
+
+    def write_many(self, chunks: Iterable[bytes]) -> int:
+        """Join fragments and write them as a single payload."""
+        return self.write(b"".join(chunks))
 
     def __enter__(self) -> "UsbTransport":
         """Context manager entry."""
@@ -96,20 +218,30 @@ class UsbTransport:
         self.close()
 
 
-def list_usb_printers() -> list[dict]:
-    """List USB devices that might be printers."""
-    import usb.core
+def list_usb_printers(include_unknown: bool = False) -> list[dict]:
+    """
+    List USB devices that might be printers.
+
+    Args:
+        include_unknown: Also list devices from vendors not in KNOWN_PRINTER_VIDS
 
+    Returns:
+        Device info dicts with vendor/product IDs and descriptor strings
+    """
+    global _enum_cache
+    usb = _get_usb()
     printers = []
 
-    # Common thermal printer vendor IDs
-    # 0x0483 = STMicroelectronics (many thermal printers)
-    # 0x0416 = WinChipHead (CH340)
-    # 0x1a86 = QinHeng Electronics
-    # 0x04b8 = Epson
-    # 0x0dd4 = Custom Engineering
+    devices = list(usb.core.find(find_all=True))
+    # Cached so that opening one of the listed devices skips re-enumeration
+    _enum_cache = (time.monotonic(), devices)
+
+    for device in devices:
+        # Filter before reading string descriptors, which each cost a
+        # control transfer to the device
+        if not include_unknown and device.idVendor not in KNOWN_PRINTER_VIDS:
+            continue
 
-    for device in usb.core.find(find_all=True):
         try:
             manufacturer = device.manufacturer or "Unknown"
             product = device.product or "Unknown"
@@ -0,0 +1,12 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from idea_print.transport import MemoryTransport
+
+
+@pytest.fixture
+def transport():
+    """Create an in-memory transport so tests avoid real I/O."""
+    with MemoryTransport() as transport:
+        yield transport
@@ -1,10 +1,18 @@
 """Tests for HMAC authentication."""
 
+import hashlib
+import hmac
 import time
 
 import pytest
 
-from idea_print.auth import AuthResult, generate_signature, verify_signature
+from idea_print.auth import (
+    SIG_ALG_BLAKE2B,
+    AuthResult,
+    check_headers,
+    generate_signature,
+    verify_signature,
+)
 
 
 class TestVerifySignature:
@@ -39,6 +47,48 @@ class TestVerifySignature:
         assert result.success is False
         assert result.error == "Invalid signature"
 
+    def test_uppercase_hex_signature(self):
+        """Test that hex case does not affect verification."""
+        secret = "test-secret-key"
+        body = b'{"idea_text": "Hello"}'
+        timestamp = str(int(time.time()))
+        signature = generate_signature(body, int(timestamp), secret).upper()
+
+        result = verify_signature(
+            body=body,
+            signature=signature,
+            timestamp=timestamp,
+            secret=secret,
+        )
+
+        assert result.success is True
+
+    @pytest.mark.parametrize(
+        "pad",
+        [
+            lambda sig: " " + sig,
+            lambda sig: sig + " ",
+            lambda sig: sig[:32] + " " + sig[32:],
+            lambda sig: " ".join(sig[i : i + 2] for i in range(0, len(sig), 2)),
+        ],
+    )
+    def test_whitespace_in_signature_rejected(self, pad):
+        """Test that whitespace in the signature is not skipped over."""
+        secret = "test-secret-key"
+        body = b'{"idea_text": "Hello"}'
+        timestamp = str(int(time.time()))
+        signature = generate_signature(body, int(timestamp), secret)
+
+        result = verify_signature(
+            body=body,
+            signature=pad(signature),
+            timestamp=timestamp,
+            secret=secret,
+        )
+
+        assert result.success is False
+        assert result.error == "Invalid signature"
+
     def test_missing_signature(self):
         """Test rejection when signature is missing."""
         result = verify_signature(
@@ -75,6 +125,19 @@ class TestVerifySignature:
         assert result.success is False
         assert "Invalid timestamp format" in result.error
 
+    @pytest.mark.parametrize("timestamp", ["-1700000000", " 1700000000", "\u0661\u0662", "1" * 5000])
+    def test_non_digit_timestamp_rejected(self, timestamp):
+        """Test rejection of signed, padded, non-ASCII or overlong timestamps."""
+        result = verify_signature(
+            body=b'{"idea_text": "Hello"}',
+            signature="some-signature",
+            timestamp=timestamp,
+            secret="test-secret",
+        )
+
+        assert result.success is False
+        assert "Invalid timestamp format" in result.error
+
     def test_expired_timestamp(self):
         """Test rejection of old timestamp."""
         old_timestamp = str(int(time.time()) - 600)  # 10 minutes ago
@@ -145,6 +208,54 @@ class TestVerifySignature:
         )
         assert result.success is False
 
+    def test_valid_blake2b_signature(self):
+        """Test verification of keyed BLAKE2b signature."""
+        secret = "test-secret-key"
+        body = b'{"idea_text": "Hello"}'
+        timestamp = str(int(time.time()))
+        signature = generate_signature(body, int(timestamp), secret, SIG_ALG_BLAKE2B)
+
+        result = verify_signature(
+            body=body,
+            signature=signature,
+            timestamp=timestamp,
+            secret=secret,
+            algorithm=SIG_ALG_BLAKE2B,
+        )
+
+        assert result.success is True
+
+    def test_algorithm_mismatch_rejected(self):
+        """Test that an HMAC signature does not verify as BLAKE2b."""
+        secret = "test-secret-key"
+        body = b'{"idea_text": "Hello"}'
+        timestamp = str(int(time.time()))
+        signature = generate_signature(body, int(timestamp), secret)
+
+        result = verify_signature(
+            body=body,
+            signature=signature,
+            timestamp=timestamp,
+            secret=secret,
+            algorithm=SIG_ALG_BLAKE2B,
+        )
+
+        assert result.success is False
+        assert result.error == "Invalid signature"
+
+    def test_unsupported_algorithm(self):
+        """Test rejection of unknown signature algorithm."""
+        result = verify_signature(
+            body=b'{"idea_text": "Hello"}',
+            signature="some-signature",
+            timestamp=str(int(time.time())),
+            secret="test-secret",
+            algorithm="md5",
+        )
+
+        assert result.success is False
+        assert "Unsupported signature algorithm" in result.error
+
 
 class TestGenerateSignature:
     """Tests for signature generation."""
@@ -202,6 +313,36 @@ class TestGenerateSignature:
 
         assert sig1 != sig2
 
+    def test_matches_reference_hmac(self):
+        """Test that cached-key signatures match a fresh HMAC of timestamp + body."""
+        secret = "my-secret"
+
+        # Repeated calls reuse the cached key; none may leak state into the next
+        for body, timestamp in [(b"first", 1000), (b"second", 2000), (b"first", 1000)]:
+            expected = hmac.new(
+                secret.encode(),
+                str(timestamp).encode() + body,
+                hashlib.sha256,
+            ).hexdigest()
+            assert generate_signature(body, timestamp, secret) == expected
+
+    def test_blake2b_signature_format(self):
+        """Test that BLAKE2b signature is 64 hex characters."""
+        signature = generate_signature(
+            body=b"test",
+            timestamp=12345,
+            secret="secret",
+            algorithm=SIG_ALG_BLAKE2B,
+        )
+
+        assert len(signature) == 64
+        assert signature != generate_signature(b"test", 12345, "secret")
+
+    def test_unsupported_algorithm_raises(self):
+        """Test that generating with an unknown algorithm raises."""
+        with pytest.raises(ValueError):
+            generate_signature(b"test", 12345, "secret", algorithm="md5")
+
 
 class TestAuthResult:
     """Tests for AuthResult dataclass."""
@@ -217,3 +358,29 @@ class TestAuthResult:
         result = AuthResult(success=False, error="Some error")
         assert result.success is False
         assert result.error == "Some error"
+
+
+class TestCheckHeaders:
+    """Tests for body-independent header checks."""
+
+    def test_valid_headers(self):
+        """Test that well-formed, fresh headers pass."""
+        result = check_headers(
+            signature="some-signature",
+            timestamp=str(int(time.time())),
+            secret="test-secret",
+        )
+
+        assert result.success is True
+
+    def test_expired_timestamp(self):
+        """Test rejection of old timestamp without a body."""
+        result = check_headers(
+            signature="some-signature",
+            timestamp=str(int(time.time()) - 600),
+            secret="test-secret",
+            window_seconds=300,
+        )
+
+        assert result.success is False
+        assert "too old" in result.error
@@ -0,0 +1,163 @@
+"""Tests for request deduplication store."""
+
+import sqlite3
+import time
+
+import pytest
+
+from idea_print import dedupe
+from idea_print.dedupe import DedupeStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a dedupe store backed by a temporary database."""
+    store = DedupeStore(tmp_path / "dedupe.db")
+    yield store
+    store.close()
+
+
+class TestDedupeStore:
+    """Tests for the DedupeStore class."""
+
+    def test_check_and_mark_new_request(self, store):
+        """Test that a new request ID is accepted."""
+        assert store.check_and_mark("req-1") is True
+
+    def test_check_and_mark_duplicate(self, store):
+        """Test that a repeated request ID is rejected."""
+        assert store.check_and_mark("req-1") is True
+        assert store.check_and_mark("req-1") is False
+        assert store.check_and_mark("req-2") is True
+
+    def test_is_duplicate_after_mark(self, store):
+        """Test is_duplicate reflects mark_processed."""
+        assert store.is_duplicate("req-1") is False
+        store.mark_processed("req-1")
+        assert store.is_duplicate("req-1") is True
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that processed IDs survive reopening the store."""
+        db_path = tmp_path / "dedupe.db"
+        first = DedupeStore(db_path)
+        first.check_and_mark("req-1")
+        first.close()
+
+        second = DedupeStore(db_path)
+        try:
+            assert second.is_duplicate("req-1") is True
+            assert second.check_and_mark("req-1") is False
+        finally:
+            second.close()
+
+    def test_cleanup_expired(self, tmp_path):
+        """Test that expired entries are removed."""
+        store = DedupeStore(tmp_path / "dedupe.db", ttl_seconds=-1)
+        try:
+            store.mark_processed("req-1")
+            assert store.cleanup_expired() == 1
+            assert store.is_duplicate("req-1") is False
+        finally:
+            store.close()
+
+    def test_duplicate_after_eviction_from_recent(self, tmp_path):
+        """Test that IDs evicted from the in-memory cache are still caught."""
+        store = DedupeStore(tmp_path / "dedupe.db", recent_capacity=1)
+        try:
+            assert store.check_and_mark("req-1") is True
+            assert store.check_and_mark("req-2") is True
+            assert store.check_and_mark("req-1") is False
+        finally:
+            store.close()
+
+    def test_check_and_mark_after_cleanup(self, tmp_path):
+        """Test that an expired ID is accepted again after cleanup."""
+        store = DedupeStore(tmp_path / "dedupe.db", ttl_seconds=-1)
+        try:
+            assert store.check_and_mark("req-1") is True
+            store.close()
+            store = DedupeStore(tmp_path / "dedupe.db", ttl_seconds=-1)
+            assert store.cleanup_expired() == 1
+            assert store.check_and_mark("req-1") is True
+        finally:
+            store.close()
+
+    def test_cleanup_after_database_hit(self, tmp_path, monkeypatch):
+        """Test that a retry served from the database doesn't extend the TTL."""
+        clock = [1000]
+        monkeypatch.setattr(dedupe.time, "time", lambda: clock[0])
+        store = DedupeStore(tmp_path / "dedupe.db", ttl_seconds=100, recent_capacity=1)
+        try:
+            store.mark_processed("req-1")
+            clock[0] = 1060
+            store.mark_processed("req-2")  # evicts req-1 from memory
+            clock[0] = 1070
+            assert store.check_and_mark("req-1") is False  # database hit
+
+            clock[0] = 1155
+            assert store.cleanup_expired() == 1
+            assert store.is_duplicate("req-1") is False
+            assert store.check_and_mark("req-1") is True
+        finally:
+            store.close()
+
+    def test_ids_added_during_cleanup_stay_duplicates(self, tmp_path, monkeypatch):
+        """Test that IDs marked while the Bloom filter is rebuilt aren't lost."""
+        store = DedupeStore(tmp_path / "dedupe.db", recent_capacity=1)
+        marked = []
+
+        class HookedBloomFilter(dedupe._BloomFilter):
+            def update(self, keys):
+                super().update(keys)
+                # The rebuild runs without locks, so requests can arrive
+                if not marked:
+                    marked.append(store.check_and_mark("req-1"))
+                    marked.append(store.check_and_mark("req-2"))
+
+        monkeypatch.setattr(dedupe, "_BloomFilter", HookedBloomFilter)
+        try:
+            store.cleanup_expired()
+            assert marked == [True, True]
+            assert store.check_and_mark("req-1") is False
+        finally:
+            store.close()
+
+    def test_failed_write_is_retried(self, tmp_path, monkeypatch):
+        """Test that a batch whose insert fails is persisted on a later attempt."""
+        monkeypatch.setattr(dedupe, "WRITE_RETRY_DELAY", 0.01)
+        db_path = tmp_path / "dedupe.db"
+        store = DedupeStore(db_path)
+
+        class FlakyConnection:
+            """Connection whose first executemany fails as if the database were locked."""
+
+            def __init__(self, conn):
+                self._conn = conn
+                self.failures = 1
+
+            def executemany(self, sql, params):
+                if self.failures:
+                    self.failures -= 1
+                    raise sqlite3.OperationalError("database is locked")
+                return self._conn.executemany(sql, params)
+
+            def __getattr__(self, name):
+                return getattr(self._conn, name)
+
+        with store._lock:
+            store._conn = FlakyConnection(store._conn)
+        try:
+            assert store.check_and_mark("req-1") is True
+            deadline = time.monotonic() + 5
+            while store._unwritten and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert store._conn.failures == 0
+            assert not store._unwritten
+        finally:
+            store.close()
+
+        reopened = DedupeStore(db_path)
+        try:
+            assert reopened.is_duplicate("req-1") is True
+        finally:
+            reopened.close()
@@ -57,6 +57,14 @@ class TestRenderer:
         assert len(lines) == 1
         assert lines[0] == text
 
+    def test_wrap_text_non_ascii(self):
+        """Test wrapping of non-ASCII text; no-break spaces keep words together."""
+        renderer = Renderer(PrinterProfile(chars_per_line=12))
+        text = "Café crème brûlée 100\u00a0km"
+        lines = renderer.wrap_text(text)
+
+        assert lines == ["Café crème", "brûlée", "100\u00a0km"]
+
     def test_render_block_basic(self):
         """Test basic text block rendering."""
         renderer = Renderer()
@@ -99,6 +107,16 @@ class TestRenderer:
         # Should end with feed and cut
         assert CUT_FULL in result
 
+    def test_render_into_appends_to_buffer(self):
+        """Test rendering into an existing buffer matches render()."""
+        renderer = Renderer()
+        blocks = [TextBlock(text="Body text here")]
+        buf = bytearray(b"prefix")
+
+        renderer.render_into(blocks, buf)
+
+        assert bytes(buf) == b"prefix" + renderer.render(blocks)
+
     def test_render_line(self):
         """Test horizontal line rendering."""
         renderer = Renderer(PrinterProfile(chars_per_line=20))
@@ -136,6 +154,18 @@ class TestEscPosCommands:
         assert feed(1) == b"\x1bd\x01"
         assert feed(4) == b"\x1bd\x04"
 
+    def test_feed_command_bounds(self):
+        """Test feed accepts the full byte range."""
+        assert feed(0) == b"\x1bd\x00"
+        assert feed(255) == b"\x1bd\xff"
+
+    def test_feed_command_out_of_range(self):
+        """Test feed rejects counts that don't fit in one byte."""
+        with pytest.raises(ValueError):
+            feed(-1)
+        with pytest.raises(ValueError):
+            feed(256)
+
     def test_cut_command(self):
         """Test cut command bytes."""
         assert CUT_FULL == b"\x1dV\x00"
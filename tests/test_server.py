@@ -0,0 +1,280 @@
+"""Tests for the FastAPI server."""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+from idea_print import server
+from idea_print.auth import generate_signature
+from idea_print.config import get_config
+from idea_print.server import MAX_BODY_BYTES, app
+
+
+@pytest.fixture
+def env(monkeypatch, tmp_path):
+    """Configure the server to print to a temporary file, without auth."""
+    monkeypatch.setenv("PRINTER_TRANSPORT", "file")
+    monkeypatch.setenv("FILE_OUTPUT_PATH", str(tmp_path / "receipt.bin"))
+    monkeypatch.setenv("DEDUPE_ENABLED", "false")
+    monkeypatch.delenv("HMAC_SECRET", raising=False)
+    monkeypatch.delenv("TRUST_LOCAL", raising=False)
+    get_config.cache_clear()
+    yield monkeypatch
+    get_config.cache_clear()
+
+
+@pytest.fixture
+def client(env):
+    """Create a test client with the application lifespan running."""
+    with TestClient(app) as client:
+        yield client
+
+
+def configure_auth(env, trust_local: bool) -> None:
+    """Require signatures, optionally trusting loopback clients."""
+    env.setenv("HMAC_SECRET", "test-secret")
+    env.setenv("TRUST_LOCAL", "true" if trust_local else "false")
+    get_config.cache_clear()
+
+
+def signed_headers(body: bytes, timestamp: int | None = None) -> dict[str, str]:
+    """Build headers for a request signed with the test secret."""
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    return {
+        "Content-Type": "application/json",
+        "X-Timestamp": str(timestamp),
+        "X-Signature": generate_signature(body, timestamp, "test-secret"),
+    }
+
+
+class TestPrint:
+    """Tests for printing through the /print endpoint."""
+
+    def test_print_success(self, client, tmp_path):
+        """Test that a print request reaches the printer."""
+        response = client.post("/print", json={"idea_text": "Test idea", "idea_id": "IDEA-001"})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "success": True,
+            "message": "Receipt printed successfully",
+            "idea_id": "IDEA-001",
+        }
+        assert b"Test idea" in (tmp_path / "receipt.bin").read_bytes()
+
+    def test_print_without_lifespan(self, env, tmp_path):
+        """Test printing when the app's lifespan hasn't run (e.g. mounted)."""
+        client = TestClient(app)
+
+        response = client.post("/print", json={"idea_text": "Test idea"})
+
+        assert response.status_code == 200
+        assert b"Test idea" in (tmp_path / "receipt.bin").read_bytes()
+
+    def test_transport_error_returns_500(self, client, env):
+        """Test that a transport failure is reported as a 500."""
+
+        def fail(config, receipt_bytes):
+            raise OSError("printer offline")
+
+        env.setattr(server, "print_bytes", fail)
+
+        response = client.post("/print", json={"idea_text": "Test idea"})
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Print failed: printer offline"
+
+    def test_prints_are_serialized(self, client, env):
+        """Test that concurrent requests never print at the same time."""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def slow_print(config, receipt_bytes):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        env.setattr(server, "print_bytes", slow_print)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            responses = list(
+                pool.map(
+                    lambda i: client.post("/print", json={"idea_text": f"Idea {i}"}),
+                    range(4),
+                )
+            )
+
+        assert [r.status_code for r in responses] == [200] * 4
+        assert peak == 1
+
+
+class TestBodyLimit:
+    """Tests for the /print body size limit."""
+
+    def test_worst_case_escaped_body_accepted(self, client):
+        """Test that maximum-length text outside the BMP fits the limit."""
+        body = json.dumps({"idea_text": "\U0001f4a1" * 10000, "idea_id": "IDEA-001"})
+
+        response = client.post(
+            "/print", content=body, headers={"Content-Type": "application/json"}
+        )
+
+        assert response.status_code == 200
+
+    def test_oversized_content_length_rejected(self, client):
+        """Test rejection of a body declared larger than the limit."""
+        response = client.post(
+            "/print",
+            content=b"x" * (MAX_BODY_BYTES + 1),
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 413
+        assert response.json()["detail"] == "Request body too large"
+
+    def test_oversized_chunked_body_rejected(self, client):
+        """Test rejection of a chunked body that grows past the limit."""
+
+        def chunks():
+            yield b"x" * MAX_BODY_BYTES
+            yield b"x"
+
+        response = client.post(
+            "/print", content=chunks(), headers={"Content-Type": "application/json"}
+        )
+
+        assert response.status_code == 413
+
+
+class TestTrustLocal:
+    """Tests for skipping signature checks for loopback clients."""
+
+    BODY = b'{"idea_text": "Test idea"}'
+
+    def post(self, host: str, headers: dict[str, str] | None = None):
+        """Post BODY to /print as a client at the given address."""
+        with TestClient(app, client=(host, 50000)) as client:
+            return client.post(
+                "/print",
+                content=self.BODY,
+                headers=headers or {"Content-Type": "application/json"},
+            )
+
+    @pytest.mark.parametrize("host", ["127.0.0.1", "::1"])
+    def test_loopback_trusted_when_enabled(self, env, host):
+        """Test that loopback clients skip signatures with TRUST_LOCAL=true."""
+        configure_auth(env, trust_local=True)
+
+        assert self.post(host).status_code == 200
+
+    def test_loopback_requires_signature_when_disabled(self, env):
+        """Test that loopback clients need a signature by default."""
+        configure_auth(env, trust_local=False)
+
+        response = self.post("127.0.0.1")
+
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Missing signature"
+
+    def test_remote_requires_signature(self, env):
+        """Test that non-loopback clients always need a signature."""
+        configure_auth(env, trust_local=True)
+
+        assert self.post("203.0.113.7").status_code == 401
+        assert self.post("203.0.113.7", signed_headers(self.BODY)).status_code == 200
+
+
+class TestRequestValidation:
+    """Tests for /print body validation errors."""
+
+    def test_missing_field_error_shape(self, client):
+        """Test that validation errors match FastAPI's body error format."""
+        response = client.post("/print", json={"idea_id": "IDEA-001"})
+
+        assert response.status_code == 422
+        (error,) = response.json()["detail"]
+        assert error["type"] == "missing"
+        assert error["loc"] == ["body", "idea_text"]
+        assert error["msg"] == "Field required"
+
+    def test_empty_text_rejected(self, client):
+        """Test that an empty idea_text fails the length constraint."""
+        response = client.post("/print", json={"idea_text": ""})
+
+        assert response.status_code == 422
+        (error,) = response.json()["detail"]
+        assert error["type"] == "string_too_short"
+        assert error["loc"] == ["body", "idea_text"]
+
+
+class TestAuthHeaders:
+    """Tests for rejecting bad auth headers before reading the body."""
+
+    BODY = b'{"idea_text": "Test idea"}'
+
+    @pytest.fixture
+    def body_reads(self, env):
+        """Record every read of the request body."""
+        reads = []
+        read_body = server.read_body
+
+        async def recording_read_body(request):
+            reads.append(request)
+            return await read_body(request)
+
+        env.setattr(server, "read_body", recording_read_body)
+        return reads
+
+    def test_stale_timestamp_rejected_before_body(self, env, client, body_reads):
+        """Test that an expired timestamp is rejected without reading the body."""
+        configure_auth(env, trust_local=False)
+        headers = signed_headers(self.BODY, timestamp=int(time.time()) - 3600)
+
+        response = client.post("/print", content=self.BODY, headers=headers)
+
+        assert response.status_code == 401
+        assert response.json()["detail"].startswith("Timestamp too old")
+        assert body_reads == []
+
+    def test_overlong_timestamp_rejected(self, env, client, body_reads):
+        """Test that a huge numeric timestamp is a 401, not a server error."""
+        configure_auth(env, trust_local=False)
+        headers = signed_headers(self.BODY)
+        headers["X-Timestamp"] = "1" * 5000
+
+        response = client.post("/print", content=self.BODY, headers=headers)
+
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Invalid timestamp format"
+        assert body_reads == []
+
+    def test_missing_signature_rejected_before_body(self, env, client, body_reads):
+        """Test that a request without a signature never has its body read."""
+        configure_auth(env, trust_local=False)
+
+        response = client.post(
+            "/print",
+            content=self.BODY,
+            headers={"Content-Type": "application/json", "X-Timestamp": str(int(time.time()))},
+        )
+
+        assert response.status_code == 401
+        assert body_reads == []
+
+    def test_valid_headers_read_body_once(self, env, client, body_reads):
+        """Test that a signed request reads its body once, shared with parsing."""
+        configure_auth(env, trust_local=False)
+
+        response = client.post("/print", content=self.BODY, headers=signed_headers(self.BODY))
+
+        assert response.status_code == 200
+        assert len(body_reads) == 1
@@ -83,6 +83,12 @@ class TestBuildReceipt:
         # Should handle encoding (may replace unknown chars)
         assert isinstance(result, bytes)
 
+    def test_receipt_unencodable_id(self):
+        """Test that an ID outside the codepage is replaced, not an error."""
+        result = build_receipt(idea_text="Idea", idea_id="IDEA-\u2603")
+
+        assert b"ID: IDEA-?" in result
+
 
 class TestBuildTestReceipt:
     """Tests for build_test_receipt function."""
@@ -0,0 +1,382 @@
+"""Tests for printer transports."""
+
+import array
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from idea_print.transport import FileTransport, MemoryTransport, SerialTransport, usb
+
+
+class TestMemoryTransport:
+    """Tests for the MemoryTransport class."""
+
+    def test_write(self, transport):
+        """Test that writes accumulate in the buffer."""
+        assert transport.write(b"\x1b@") == 2
+        assert transport.write(b"Hello\n") == 6
+
+        assert bytes(transport.buf) == b"\x1b@Hello\n"
+
+    def test_write_many(self, transport):
+        """Test that write_many appends every fragment and counts them all."""
+        transport.write(b"\x1b@")
+        chunks = [b"Hello", b"", b" world", b"\n"]
+
+        assert transport.write_many(chunks) == sum(len(chunk) for chunk in chunks)
+        assert bytes(transport.buf) == b"\x1b@" + b"".join(chunks)
+
+    def test_buffer_kept_after_close(self):
+        """Test that the written bytes stay readable after the context exits."""
+        with MemoryTransport() as transport:
+            transport.write(b"receipt")
+
+        assert bytes(transport.buf) == b"receipt"
+
+
+class TestFileTransport:
+    """Tests for the FileTransport class."""
+
+    def test_write(self, tmp_path):
+        """Test that written bytes land in the file."""
+        path = tmp_path / "receipt.bin"
+
+        with FileTransport(path) as transport:
+            assert transport.write(b"\x1b@Hello\n") == 8
+
+        assert path.read_bytes() == b"\x1b@Hello\n"
+
+    def test_reopen_truncates(self, tmp_path):
+        """Test that reopening the transport replaces the previous receipt."""
+        path = tmp_path / "receipt.bin"
+
+        with FileTransport(path) as transport:
+            transport.write(b"first receipt, the longer one")
+        with FileTransport(path) as transport:
+            transport.write(b"second")
+
+        assert path.read_bytes() == b"second"
+
+    def test_write_many(self, tmp_path):
+        """Test that fragments are written as one concatenated payload."""
+        path = tmp_path / "receipt.bin"
+        chunks = [b"\x1b@", b"Hello", b"\n"]
+
+        with FileTransport(path) as transport:
+            assert transport.write_many(chunks) == 8
+
+        assert path.read_bytes() == b"".join(chunks)
+
+    def test_write_before_open(self, tmp_path):
+        """Test that writing without opening raises."""
+        transport = FileTransport(tmp_path / "receipt.bin")
+
+        with pytest.raises(RuntimeError, match="not open"):
+            transport.write(b"data")
+
+    def test_write_after_close(self, tmp_path):
+        """Test that writing after closing raises."""
+        transport = FileTransport(tmp_path / "receipt.bin")
+        transport.open()
+        transport.close()
+
+        with pytest.raises(RuntimeError, match="not open"):
+            transport.write(b"data")
+
+
+@pytest.fixture
+def pty_port():
+    """Open a pseudo-terminal; yields (master fd, slave device path)."""
+    pty = pytest.importorskip("pty")
+    master, slave = pty.openpty()
+    try:
+        yield master, os.ttyname(slave)
+    finally:
+        os.close(master)
+        os.close(slave)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs a POSIX pty")
+class TestSerialTransport:
+    """Tests for SerialTransport's descriptor writes, against a pty."""
+
+    # Far larger than a pty's buffer, so writes must wait for the reader
+    PAYLOAD = bytes(range(256)) * 1024
+
+    def test_large_write(self, pty_port):
+        """Test that a payload larger than the port buffer arrives intact."""
+        master, device = pty_port
+        received = bytearray()
+
+        def drain():
+            while len(received) < len(self.PAYLOAD):
+                received.extend(os.read(master, 65536))
+
+        reader = threading.Thread(target=drain, daemon=True)
+        reader.start()
+        with SerialTransport(device, write_timeout=5.0) as transport:
+            assert transport.write(self.PAYLOAD) == len(self.PAYLOAD)
+        reader.join(timeout=5.0)
+
+        assert bytes(received) == self.PAYLOAD
+
+    def test_write_timeout(self, pty_port):
+        """Test that a write the port can't take in time raises."""
+        serial = pytest.importorskip("serial")
+        _, device = pty_port
+
+        with SerialTransport(device, write_timeout=0.1) as transport:
+            with pytest.raises(serial.SerialTimeoutException):
+                transport.write(self.PAYLOAD)
+
+    def test_zero_write_timeout_writes_partially(self, pty_port):
+        """Test that write_timeout=0 returns the count written, like pyserial."""
+        _, device = pty_port
+
+        with SerialTransport(device, write_timeout=0) as transport:
+            written = transport.write(self.PAYLOAD)
+
+        assert 0 < written < len(self.PAYLOAD)
+
+    def test_write_nowait_returns_remainder(self, pty_port):
+        """Test that write_nowait hands back exactly the unwritten tail."""
+        _, device = pty_port
+
+        with SerialTransport(device) as transport:
+            remainder = transport.write_nowait(self.PAYLOAD)
+
+        assert 0 < len(remainder) < len(self.PAYLOAD)
+        assert remainder == self.PAYLOAD[len(self.PAYLOAD) - len(remainder) :]
+
+
+class TestUsbEnumCache:
+    """Tests for the cached USB device enumeration."""
+
+    class Device:
+        idVendor = 0x04B8
+        idProduct = 0x0202
+
+    def test_fresh_cache_hit(self, monkeypatch):
+        """Test that a just-listed device is found without enumerating."""
+        device = self.Device()
+        monkeypatch.setattr(usb, "_enum_cache", (time.monotonic(), [device]))
+
+        assert usb._find_cached(0x04B8, 0x0202) is device
+        assert usb._find_cached(0x04B8, 0x0203) is None
+
+    def test_expired_cache_dropped(self, monkeypatch):
+        """Test that an expired enumeration is released, not just ignored."""
+        expired = time.monotonic() - usb.ENUM_CACHE_TTL - 1
+        monkeypatch.setattr(usb, "_enum_cache", (expired, [self.Device()]))
+
+        assert usb._find_cached(0x04B8, 0x0202) is None
+        assert usb._enum_cache is None
+
+
+class StubEndpoint:
+    """USB OUT endpoint that records transfers instead of sending them."""
+
+    def __init__(self, events: list, accepts: list[int] | None = None, delay: float = 0.0):
+        self.events = events
+        self.transfers: list = []
+        # Bytes accepted per transfer, in order; the whole chunk once exhausted
+        self.accepts = list(accepts or [])
+        self.delay = delay
+
+    def write(self, data) -> int:
+        time.sleep(self.delay)
+        self.transfers.append(data)
+        self.events.append(("write", bytes(data)))
+        return self.accepts.pop(0) if self.accepts else len(data)
+
+
+@pytest.fixture
+def usb_events(monkeypatch):
+    """Stand in for pyusb; returns the list of recorded endpoint/device events."""
+    events = []
+    fake_usb = SimpleNamespace(
+        util=SimpleNamespace(dispose_resources=lambda device: events.append(("dispose",)))
+    )
+    monkeypatch.setattr(usb, "_usb_mod", fake_usb)
+    return events
+
+
+def open_usb_transport(endpoint: StubEndpoint) -> usb.UsbTransport:
+    """Build a UsbTransport that looks open, writing to a stub endpoint."""
+    transport = usb.UsbTransport(vendor_id=0x04B8, product_id=0x0202)
+    transport._device = object()
+    transport._endpoint = endpoint
+    return transport
+
+
+class TestUsbWrite:
+    """Tests for UsbTransport's chunked bulk writes."""
+
+    def test_large_payload_split_into_transfers(self, usb_events):
+        """Test that payloads over TRANSFER_SIZE go out in consecutive chunks."""
+        endpoint = StubEndpoint(usb_events)
+        transport = open_usb_transport(endpoint)
+        payload = bytes(range(256)) * 160  # 40 KiB
+
+        assert transport.write(payload) == len(payload)
+
+        assert [len(t) for t in endpoint.transfers] == [
+            usb.TRANSFER_SIZE,
+            usb.TRANSFER_SIZE,
+            len(payload) - 2 * usb.TRANSFER_SIZE,
+        ]
+        assert b"".join(bytes(t) for t in endpoint.transfers) == payload
+
+    def test_short_write_resumes_at_offset(self, usb_events):
+        """Test that a short transfer is followed by exactly the unsent rest."""
+        endpoint = StubEndpoint(usb_events, accepts=[100])
+        transport = open_usb_transport(endpoint)
+        payload = bytes(range(256)) * 4
+
+        assert transport.write(payload) == len(payload)
+
+        assert bytes(endpoint.transfers[0]) == payload
+        assert bytes(endpoint.transfers[1]) == payload[100:]
+        assert len(endpoint.transfers) == 2
+
+    def test_zero_progress_raises(self, usb_events):
+        """Test that a transfer accepting nothing raises instead of spinning."""
+        endpoint = StubEndpoint(usb_events, accepts=[0])
+        transport = open_usb_transport(endpoint)
+
+        with pytest.raises(RuntimeError, match="no progress"):
+            transport.write(b"receipt")
+
+    def test_transfers_are_byte_arrays(self, usb_events):
+        """Test that pyusb is handed array('B') buffers it can pass straight through."""
+        endpoint = StubEndpoint(usb_events, accepts=[10])
+        transport = open_usb_transport(endpoint)
+
+        transport.write(bytes(usb.TRANSFER_SIZE * 2))
+
+        assert len(endpoint.transfers) == 3
+        for transfer in endpoint.transfers:
+            assert isinstance(transfer, array.array)
+            assert transfer.typecode == "B"
+
+    def test_write_before_open(self):
+        """Test that writing without opening raises."""
+        transport = usb.UsbTransport(vendor_id=0x04B8, product_id=0x0202)
+
+        with pytest.raises(RuntimeError, match="not open"):
+            transport.write(b"data")
+
+
+class TestUsbWriteAsync:
+    """Tests for UsbTransport's background writes."""
+
+    def test_writes_complete_in_submission_order(self, usb_events):
+        """Test that async writes, then a sync write, reach the device in order."""
+        endpoint = StubEndpoint(usb_events, delay=0.01)
+        transport = open_usb_transport(endpoint)
+
+        futures = [transport.write_async(bytes([i]) * 4) for i in range(5)]
+        assert transport.write(b"sync") == 4
+        # The sync write queued behind every pending async write
+        assert all(future.done() for future in futures)
+        transport.close()
+
+        assert [future.result() for future in futures] == [4] * 5
+        assert usb_events[:-1] == [("write", bytes([i]) * 4) for i in range(5)] + [
+            ("write", b"sync")
+        ]
+
+    def test_close_waits_for_pending_writes(self, usb_events):
+        """Test that close() drains pending writes before releasing the device."""
+        endpoint = StubEndpoint(usb_events, delay=0.2)
+        transport = open_usb_transport(endpoint)
+
+        future = transport.write_async(b"receipt")
+        transport.close()
+
+        assert future.done()
+        assert usb_events == [("write", b"receipt"), ("dispose",)]
+
+    def test_write_async_before_open(self):
+        """Test that write_async refuses to queue on a closed transport."""
+        transport = usb.UsbTransport(vendor_id=0x04B8, product_id=0x0202)
+
+        with pytest.raises(RuntimeError, match="not open"):
+            transport.write_async(b"data")
+
+
+class FakeUsbDevice:
+    """USB device whose string descriptors record (or forbid) being read."""
+
+    def __init__(self, vendor_id: int, product_id: int, reads: list, readable: bool = True):
+        self.idVendor = vendor_id
+        self.idProduct = product_id
+        self._reads = reads
+        self._readable = readable
+
+    def _descriptor(self, value: str) -> str:
+        if not self._readable:
+            raise AssertionError(f"descriptor read from {self.idVendor:04x}")
+        self._reads.append(self.idVendor)
+        return value
+
+    @property
+    def manufacturer(self) -> str:
+        return self._descriptor("Maker")
+
+    @property
+    def product(self) -> str:
+        return self._descriptor("Device")
+
+    @property
+    def serial_number(self) -> str:
+        return self._descriptor("SN1")
+
+
+class TestListUsbPrinters:
+    """Tests for USB printer discovery."""
+
+    UNKNOWN_VID = 0x046D  # not a printer vendor
+
+    @pytest.fixture
+    def fake_find(self, monkeypatch):
+        """Make pyusb enumerate the given devices."""
+        monkeypatch.setattr(usb, "_enum_cache", None)
+
+        def install(devices):
+            core = SimpleNamespace(
+                USBError=OSError, find=lambda find_all=False: iter(devices)
+            )
+            monkeypatch.setattr(usb, "_usb_mod", SimpleNamespace(core=core))
+
+        return install
+
+    def test_unknown_vendors_not_read(self, fake_find):
+        """Test that non-printer devices are skipped before any descriptor read."""
+        reads = []
+        fake_find([
+            FakeUsbDevice(0x04B8, 0x0202, reads),
+            FakeUsbDevice(self.UNKNOWN_VID, 0xC52B, reads, readable=False),
+        ])
+
+        printers = usb.list_usb_printers()
+
+        assert [p["vendor_id"] for p in printers] == ["0x04b8"]
+        assert set(reads) == {0x04B8}
+
+    def test_include_unknown(self, fake_find):
+        """Test that include_unknown lists every device."""
+        reads = []
+        fake_find([
+            FakeUsbDevice(0x04B8, 0x0202, reads),
+            FakeUsbDevice(self.UNKNOWN_VID, 0xC52B, reads),
+        ])
+
+        printers = usb.list_usb_printers(include_unknown=True)
+
+        assert [p["vendor_id"] for p in printers] == ["0x04b8", "0x046d"]
+        assert set(reads) == {0x04B8, self.UNKNOWN_VID}